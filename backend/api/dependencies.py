@@ -1,18 +1,26 @@
-from fastapi import Depends, HTTPException, status
-from core.security import oauth2_scheme, verify_token
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
+from core.security import oauth2_scheme, verify_token_cached
 from schemas.user_schema import User as UserSchema
 from db.session import get_db_session, SessionLocal
 from core.config import settings
 from db.mongodb import get_mongo_db
 from db.models.user import User as UserModel
+from services.identity_cache import get_identity, cache_identity, identity_generation
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db_session)) -> UserSchema:
-    payload = verify_token(token)
+def _token_payload(request: Request, token: str) -> Optional[dict]:
+    # RequestContextMiddleware already verified this token; only decode if it did not run
+    if getattr(request.state, "token", None) == token:
+        return request.state.token_payload
+    return verify_token_cached(token)
+
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db_session)) -> UserSchema:
+    payload = _token_payload(request, token)
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,6 +48,12 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
         # Malformed token
         raise HTTPException(status_code=404, detail="User not found")
 
+    # Identity changes (credits, role, profile) invalidate this entry, so a hit skips the DB entirely
+    cached = get_identity(username)
+    if cached is not None:
+        return UserSchema(**cached)
+    generation = identity_generation(username)
+
     async def _fetch(session: AsyncSession, uname: str):
         result = await session.execute(select(UserModel).where(UserModel.username == uname))
         return result.scalars().first()
@@ -52,15 +66,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             if mdb is not None and username:
                 doc = await mdb.users.find_one({"username": username})
                 if doc:
-                    return UserSchema(
-                        username=doc.get("username", username),
-                        email=doc.get("email", email),
-                        user_id=doc.get("user_id", user_id),
-                        role=doc.get("role", role),
-                        services=[],
-                        credits=int(doc.get("credits", 0)),
-                        btc_address=str(doc.get("btc_address", "")),
-                    )
+                    record = {
+                        "username": doc.get("username", username),
+                        "email": doc.get("email", email),
+                        "user_id": doc.get("user_id", user_id),
+                        "role": doc.get("role", role),
+                        "services": [],
+                        "credits": int(doc.get("credits", 0)),
+                        "btc_address": str(doc.get("btc_address", "")),
+                        "data_version": int(doc.get("data_version", 0)),
+                    }
+                    cache_identity(username, record, generation)
+                    return UserSchema(**record)
         except Exception:
             pass
         return token_user
@@ -84,15 +101,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
         # If DB says no user, still return token claims to avoid 500s due to transient replication
         return token_user
 
-    return UserSchema(
-        username=db_user.username,
-        email=db_user.email,
-        user_id=db_user.user_id or db_user.username,
-        role=db_user.role,
-        services=db_user.services or [],
-        credits=db_user.credits,
-        btc_address=db_user.btc_address or "",
-    )
+    record = {
+        "username": db_user.username,
+        "email": db_user.email,
+        "user_id": db_user.user_id or db_user.username,
+        "role": db_user.role,
+        "services": db_user.services or [],
+        "credits": db_user.credits,
+        "btc_address": db_user.btc_address or "",
+        "data_version": int(db_user.data_version or 0),
+    }
+    cache_identity(username, record, generation)
+    return UserSchema(**record)
 
 async def admin_required(current_user: UserSchema = Depends(get_current_user)) -> UserSchema:
     if current_user.role != "admin":
@@ -100,8 +120,8 @@ async def admin_required(current_user: UserSchema = Depends(get_current_user)) -
     return current_user
 
 # Fast path: trust JWT claims to verify admin role without DB hit
-async def admin_required_fast(token: str = Depends(oauth2_scheme)) -> UserSchema:
-    payload = verify_token(token)
+async def admin_required_fast(request: Request, token: str = Depends(oauth2_scheme)) -> UserSchema:
+    payload = _token_payload(request, token)
     if not payload:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
     role = payload.get("role")
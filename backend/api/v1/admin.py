@@ -6,6 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from services.admin_service_async import assign_subscription, add_credits_to_user, remove_credits_from_user, remove_user_subscription, update_user_subscription_end_date, get_all_users, get_all_admin_services, add_service, update_service, delete_service, get_service_details, get_user_subscriptions_admin, update_service_credits, get_service_credits_admin
 from utils.responses import no_store_json
 from utils.timing import timeit
+from core.security import token_cache_stats
+from core.password_hasher import password_hasher
+from services.identity_cache import identity_cache_stats
+from services.email_outbox import email_outbox
+from services.http_clients import http_client_stats
+from services.paypal_auth import paypal_tokens
+from services.fx_rates import fx_rates
+from services.webhook_inbox import webhook_inbox
+from services.catalog_cache import catalog_cache_stats
+from services.account_allocator import account_allocator
+from services.subscription_expiry import subscription_expiry
+from services.dashboard_service import dashboard_cache_stats
 
 router = APIRouter()
 
@@ -78,3 +90,21 @@ async def get_admin_service_credits(service_name: str, current_user: User = Depe
 @router.put("/admin/services/{service_name}/credits")
 async def put_admin_service_credits(service_name: str, credits_map: dict, current_user: User = Depends(admin_required_fast), db: AsyncSession = Depends(get_db_session)):
     return no_store_json(await update_service_credits(service_name, credits_map, current_user, db))
+
+@timeit()
+@router.get("/admin/metrics")
+async def admin_metrics(current_user: User = Depends(admin_required_fast)):
+    return no_store_json({
+        "token_cache": token_cache_stats(),
+        "identity_cache": identity_cache_stats(),
+        "catalog_cache": catalog_cache_stats(),
+        "password_hasher": password_hasher.stats(),
+        "email_outbox": email_outbox.stats(),
+        "http_clients": http_client_stats(),
+        "paypal_token": paypal_tokens.stats(),
+        "fx_rates": fx_rates.stats(),
+        "webhook_inbox": webhook_inbox.stats(),
+        "account_allocator": account_allocator.stats(),
+        "subscription_expiry": subscription_expiry.stats(),
+        "dashboard_cache": dashboard_cache_stats(),
+    })
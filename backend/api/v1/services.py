@@ -1,21 +1,44 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from schemas.user_schema import User as UserSchema, SubscriptionPurchase
 from api.dependencies import get_current_user
 from db.session import get_db_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.config import settings
-from services.service_service import get_services, purchase_subscription, get_user_subscriptions, refresh_access_token
-from utils.responses import no_store_json
+from services.service_service import get_services_body, get_catalog_snapshot_cached, purchase_subscription, get_user_subscriptions, refresh_access_token
+from utils.responses import (
+    no_store_json,
+    etag_matches,
+    not_modified,
+    raw_json,
+    precompressed_json,
+    PRIVATE_REVALIDATE_HEADERS,
+    PUBLIC_REVALIDATE_HEADERS,
+)
+from services.response_versions import user_version, make_etag
 from utils.timing import timeit
 
 router = APIRouter()
 
 @timeit()
 @router.get("/services")
-async def list_services(current_user: UserSchema = Depends(get_current_user), db: AsyncSession = Depends(get_db_session)):
-    if settings.USE_MONGO:
-        db = None
-    return no_store_json(await get_services(current_user, db))
+async def list_services(request: Request, current_user: UserSchema = Depends(get_current_user)):
+    # The snapshot is in memory; a 304 never touches the database
+    snapshot = await get_catalog_snapshot_cached()
+    etag = make_etag("services", snapshot.version, user_version(current_user))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # The user's end dates are read on a session opened only now
+    return raw_json(await get_services_body(current_user), {**PRIVATE_REVALIDATE_HEADERS, "ETag": etag})
+
+@timeit()
+@router.get("/services/catalog")
+async def public_catalog(request: Request):
+    """Catalog without per-user data, sent from the snapshot's stored bytes."""
+    snapshot = await get_catalog_snapshot_cached()
+    etag = make_etag("catalog", snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag, PUBLIC_REVALIDATE_HEADERS)
+    return precompressed_json(request, snapshot.body, snapshot.gzip_body, {**PUBLIC_REVALIDATE_HEADERS, "ETag": etag})
 
 @timeit()
 @router.post("/purchase-subscription")
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from schemas.user_schema import User as UserSchema, UserCreate, ChangePasswordRequest
 from api.dependencies import get_current_user
 from db.session import get_db_session
@@ -10,7 +13,9 @@ from sqlalchemy import select, func
 from db.models.user import User as UserModel
 from db.models.referral import ReferralCredit
 from services.service_service import get_user_subscriptions
-from utils.responses import no_store_json
+from services.dashboard_service import get_user_dashboard
+from utils.responses import no_store_json, etag_matches, not_modified, private_json
+from services.response_versions import user_version, make_etag
 from utils.timing import timeit
 
 router = APIRouter()
@@ -54,73 +59,32 @@ async def change_password_endpoint(data: ChangePasswordRequest, current_user: Us
 
 @timeit()
 @router.get("/user/subscriptions/current")
-async def get_user_current_subscriptions(current_user: UserSchema = Depends(get_current_user), db: AsyncSession = Depends(get_db_session)):
-    if settings.USE_MONGO:
-        db = None
-    return no_store_json(await get_user_subscriptions(current_user, db))
+async def get_user_current_subscriptions(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: UserSchema = Depends(get_current_user),
+):
+    # Without limit: every subscription, as before; with it, one page plus next_cursor.
+    # is_active and days left change at midnight, so the date is part of the version.
+    etag = make_etag(
+        "subscriptions", user_version(current_user), date.today().isoformat(), str(limit or ""), cursor or ""
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # A session is opened only for a full response
+    return private_json(await get_user_subscriptions(current_user, limit=limit, cursor=cursor), etag)
 
 @timeit("get_dashboard")
 @router.get("/dashboard")
-async def get_dashboard(current_user: UserSchema = Depends(get_current_user), db: AsyncSession = Depends(get_db_session)):
-    # Use JWT data for credits; fetch only subscriptions
-    if settings.USE_MONGO:
-        db = None
-    subs_resp = await get_user_subscriptions(current_user, db)
-    subscriptions = subs_resp.get("subscriptions", [])
-    active_subs = [sub for sub in subscriptions if sub.get("is_active")]
-    recent_subs = sorted(subscriptions, key=lambda s: s.get("end_date", ""), reverse=True)[:5]
-
-    recent_min = [
-        {
-            "service_name": sub.get("service_name"),
-            "service_image": sub.get("service_image"),
-            "account_id": sub.get("account_id") or sub.get("service_id"),
-            "end_date": sub.get("end_date"),
-            "is_active": sub.get("is_active"),
-        }
-        for sub in recent_subs
-    ]
-    
-    # Get referral credits earned
-    total_credits_earned = 0
-    if settings.USE_MONGO:
-        mdb = get_mongo_db()
-        if mdb is not None:
-            user = await mdb.users.find_one({"username": current_user.username})
-            if user:
-                user_mongo_id = user.get("_id")
-                from bson import ObjectId
-                query = {"referrer_user_id": user_mongo_id}
-                try:
-                    credits = await mdb.referral_credits.find(query).to_list(length=10000)
-                    total_credits_earned = sum(int(credit.get("credits_awarded", 0)) for credit in credits)
-                except Exception:
-                    try:
-                        query_str = {"referrer_user_id": str(user_mongo_id)}
-                        credits = await mdb.referral_credits.find(query_str).to_list(length=10000)
-                        total_credits_earned = sum(int(credit.get("credits_awarded", 0)) for credit in credits)
-                    except Exception:
-                        pass
-    else:
-        # SQL path
-        user_result = await db.execute(select(UserModel).where(UserModel.username == current_user.username))
-        user = user_result.scalars().first()
-        if user:
-            stats_result = await db.execute(
-                select(
-                    func.sum(ReferralCredit.credits_awarded).label("total_credits_earned")
-                ).where(ReferralCredit.referrer_user_id == user.id)
-            )
-            stats = stats_result.first()
-            total_credits_earned = int(stats.total_credits_earned or 0) if stats else 0
-    
-    return no_store_json({
-        "username": current_user.username,
-        "credits": current_user.credits,
-        "active_subscriptions": len(active_subs),
-        "total_credits_earned": total_credits_earned,
-        "recent_subscriptions": recent_min
-    })
+async def get_dashboard(request: Request, current_user: UserSchema = Depends(get_current_user)):
+    # Unchanged since the client's copy: answer from the version alone
+    # Active counts depend on today's date as well as on the user's writes
+    etag = make_etag("dashboard", user_version(current_user), date.today().isoformat())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # Credits come from the identity; the rest is cached per user until their data changes
+    return private_json(await get_user_dashboard(current_user), etag)
 
 @timeit()
 @router.get("/me/referral-code")
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, Header, Request
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Request
 from schemas.user_schema import User, CreditDeposit
 from api.dependencies import get_current_user
 from services.wallet_service import (
     get_wallet_info,
     deposit_credits,
+    get_transaction_history,
     create_payment_invoice,
     handle_payment_webhook,
     create_paypal_order,
@@ -14,13 +16,25 @@ from services.wallet_service import (
     verify_razorpay_payment_link,
     handle_razorpay_webhook,
 )
-from utils.responses import no_store_json
+from utils.responses import no_store_json, etag_matches, not_modified, private_json
+from services.response_versions import user_version, make_etag
 
 router = APIRouter()
 
 @router.get("/wallet")
-async def get_wallet(current_user: User = Depends(get_current_user)):
-    return no_store_json(await get_wallet_info(current_user))
+async def get_wallet(request: Request, current_user: User = Depends(get_current_user)):
+    etag = make_etag("wallet", user_version(current_user))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return private_json(await get_wallet_info(current_user), etag)
+
+@router.get("/wallet/transactions")
+async def wallet_transactions(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    return no_store_json(await get_transaction_history(current_user, limit=limit, cursor=cursor))
 
 @router.post("/wallet/deposit")
 async def wallet_deposit(dep: CreditDeposit, current_user: User = Depends(get_current_user)):
@@ -70,8 +84,12 @@ async def wallet_razorpay_verify(order_id: str = None, payment_id: str = None, s
         raise HTTPException(status_code=400, detail="Missing required parameters")
 
 @router.post("/wallet/payment/razorpay/webhook")
-async def wallet_razorpay_webhook(request: Request, x_razorpay_signature: str = Header(default=None)):
+async def wallet_razorpay_webhook(
+    request: Request,
+    x_razorpay_signature: str = Header(default=None),
+    x_razorpay_event_id: str = Header(default=None),
+):
     raw = await request.body()
-    headers_map = {"x-razorpay-signature": x_razorpay_signature or ""}
+    headers_map = {"x-razorpay-signature": x_razorpay_signature or "", "x-razorpay-event-id": x_razorpay_event_id or ""}
     result = await handle_razorpay_webhook(raw, headers_map)
     return no_store_json(result)
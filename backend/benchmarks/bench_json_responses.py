@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rendering the largest admin responses with JSONResponse vs ORJSONResponse.
+
+Builds synthetic payloads shaped like GET /admin/users, GET /admin/analytics/events
+and GET /admin/services/{name} and renders each the old way (datetimes converted
+with isoformat(), then the standard-library JSONResponse) and the new way
+(datetimes left native, ORJSONResponse). Reports median/best render time and the
+peak memory allocated while rendering (tracemalloc).
+
+Run from the backend directory:
+    python -m benchmarks.bench_json_responses --rows 5000 --rounds 20
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+def _users_page(rows: int) -> dict:
+    users = [
+        {
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "role": "admin" if i % 50 == 0 else "user",
+            "credits": i * 7 % 1000,
+            "services_count": i % 6,
+        }
+        for i in range(rows)
+    ]
+    return {"users": users, "page": 1, "size": rows, "total": rows, "total_pages": 1}
+
+
+def _analytics_page(rows: int, native_dates: bool) -> dict:
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    events = []
+    for i in range(rows):
+        created_at = start + timedelta(seconds=i * 37, microseconds=i)
+        events.append({
+            "id": i,
+            "event_type": ("purchase", "login", "wallet_deposit", "admin_add_credits")[i % 4],
+            "status": "success" if i % 9 else "failed",
+            "actor_username": f"user{i % 300}",
+            "actor_role": "user",
+            "target_username": f"user{(i * 13) % 300}",
+            "source": "api",
+            "external_ref": f"order_{i:08d}",
+            "details": {"amount": i % 500, "currency": "INR", "service_name": f"svc-{i % 40}", "tags": ["a", "b", "c"]},
+            "created_at": created_at if native_dates else created_at.isoformat(),
+        })
+    by_type = {"purchase": rows // 4, "login": rows // 4, "wallet_deposit": rows // 4, "admin_add_credits": rows // 4}
+    return {"events": events, "summary": {"by_type": by_type}, "page": 1, "size": rows, "total": rows, "total_pages": 1}
+
+
+def _service_details(rows: int) -> dict:
+    accounts = [
+        {
+            "id": f"acc-{i}",
+            "password": f"pw-{i:06d}",
+            "end_date": "31/12/2026",
+            "is_active": i % 5 != 0,
+            "assigned_users": [f"user{(i + k) % 300}" for k in range(i % 4)],
+        }
+        for i in range(rows)
+    ]
+    return {"name": "bench-service", "image": "https://example.com/logo.png", "accounts": accounts, "credits": {"1month": 100, "3months": 270}}
+
+
+def _measure(response_class, payload, rounds: int):
+    samples = []
+    size = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        size = len(response_class(payload).body)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    tracemalloc.start()
+    response_class(payload)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort()
+    return samples[len(samples) // 2], samples[0], peak, size
+
+
+def _report(label: str, old_payload, new_payload, rounds: int):
+    old = _measure(JSONResponse, old_payload, rounds)
+    new = _measure(ORJSONResponse, new_payload, rounds)
+    print(f"\n{label}  ({old[3] / 1024:.0f} KiB json / {new[3] / 1024:.0f} KiB orjson)")
+    for name, (median, best, peak, _size) in (("JSONResponse", old), ("ORJSONResponse", new)):
+        print(f"  {name:<15} median={median:8.2f} ms  best={best:8.2f} ms  peak={peak / 1024:8.0f} KiB")
+    print(f"  speedup x{old[0] / new[0]:.1f}, peak memory x{old[2] / max(new[2], 1):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="admin response rendering benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows per payload, {args.rounds} rounds")
+    _report("/admin/users", _users_page(args.rows), _users_page(args.rows), args.rounds)
+    _report(
+        "/admin/analytics/events",
+        _analytics_page(args.rows, native_dates=False),
+        _analytics_page(args.rows, native_dates=True),
+        args.rounds,
+    )
+    _report("/admin/services/{name}", _service_details(args.rows), _service_details(args.rows), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: login latency and event-loop responsiveness under concurrent logins.
+
+Compares inline bcrypt (old behaviour) with the process-pool hasher. While a burst
+of logins runs, a probe coroutine stands in for every other endpoint on the worker
+and records how long it waits to be scheduled.
+
+Run from the backend directory (needs the same .env as the app):
+    python -m benchmarks.bench_password_hashing --logins 40 --workers 4
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from core.password_hasher import PasswordHashPool
+from core.security import get_password_hash, verify_password
+
+
+def _pct(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _probe(stop: asyncio.Event, samples: list, interval: float = 0.01):
+    # Each sample is how late a 10 ms timer fires: pure event-loop stall time
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - start - interval) * 1000.0)
+
+
+async def _run(mode: str, logins: int, hashed: str, pool: PasswordHashPool):
+    login_ms = []
+    probe_ms = []
+    stop = asyncio.Event()
+
+    async def login():
+        # Latency is measured from the start of the burst, as a client would see it
+        start = burst_start
+        if mode == "inline":
+            verify_password("correct horse", hashed)
+        else:
+            await pool.verify("correct horse", hashed)
+        login_ms.append((time.perf_counter() - start) * 1000.0)
+
+    probe_task = asyncio.create_task(_probe(stop, probe_ms))
+    await asyncio.sleep(0)
+    burst_start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    wall = time.perf_counter() - burst_start
+    stop.set()
+    await probe_task
+
+    print(f"\n[{mode}] {logins} concurrent logins in {wall:.2f}s")
+    print(f"  login  p50={_pct(login_ms, 50):8.1f} ms  p99={_pct(login_ms, 99):8.1f} ms")
+    print(
+        f"  other  p50={_pct(probe_ms, 50):8.1f} ms  p99={_pct(probe_ms, 99):8.1f} ms  "
+        f"max={max(probe_ms or [0]):8.1f} ms  (samples={len(probe_ms)}, mean={statistics.mean(probe_ms or [0]):.1f} ms)"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="bcrypt login benchmark")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    hashed = get_password_hash("correct horse")
+    pool = PasswordHashPool(max_workers=args.workers, max_pending=args.logins, queue_timeout=60)
+    pool.start()
+    # Warm the worker processes so the first measurement is not dominated by start-up
+    await asyncio.gather(*(pool.verify("correct horse", hashed) for _ in range(args.workers)))
+    try:
+        await _run("inline", args.logins, hashed, pool)
+        await _run("pool", args.logins, hashed, pool)
+        print(f"\npool stats: {pool.stats()}")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 class Settings(BaseSettings):
     # App settings
@@ -12,6 +12,28 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+
+    # Password hashing (bcrypt runs in a process pool off the event loop)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 5.0
+    # Recently verified access tokens kept in memory (keyed by digest, honours exp)
+    TOKEN_CACHE_SIZE: int = 4096
+    # Per-process user identity cache used by get_current_user (0 disables)
+    IDENTITY_CACHE_TTL_SECONDS: int = 30
+    IDENTITY_CACHE_SIZE: int = 10000
+    # Catalog (GET /services) cache: anonymous + per-user views, LRU with a memory budget
+    CATALOG_CACHE_TTL_SECONDS: int = 30
+    CATALOG_CACHE_SIZE: int = 5000
+    CATALOG_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # Seat allocator: per-service account load index, reloaded after this age
+    ACCOUNT_ALLOCATOR_REFRESH_SECONDS: int = 300
+    # Expiry sweeper: deactivates subscriptions past their end date, in batches
+    SUBSCRIPTION_EXPIRY_SWEEP_SECONDS: int = 900
+    SUBSCRIPTION_EXPIRY_BATCH_SIZE: int = 500
+    # Per-user dashboard sections, dropped on purchases / credit changes / referral awards
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_CACHE_SIZE: int = 10000
     
     # Admin settings
     ADMIN_USERNAME: str = "admin"
@@ -55,6 +77,34 @@ class Settings(BaseSettings):
     SMTP_USE_SSL: bool = False
     SMTP_TIMEOUT: int = 15
     SMTP_DEBUG: bool = False
+    # Email outbox: messages are persisted and delivered by background workers
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 6
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+    SMTP_IDLE_SECONDS: int = 60
+
+    # Outbound HTTP clients for payment providers (one pooled session per provider)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = 30.0
+    HTTP_CLIENT_DNS_TTL_SECONDS: int = 300
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    # Per-provider overrides of the two limits above, e.g.
+    # {"paypal": {"max_connections": 20, "max_connections_per_host": 10}}
+    HTTP_CLIENT_LIMITS: Dict[str, Dict[str, int]] = {}
+
+    # Webhook inbox: provider webhooks are stored on receipt and processed in the background
+    WEBHOOK_INBOX_CONCURRENCY: int = 4
+    WEBHOOK_INBOX_BATCH_SIZE: int = 20
+    WEBHOOK_INBOX_POLL_SECONDS: float = 2.0
+    WEBHOOK_INBOX_MAX_ATTEMPTS: int = 8
+    WEBHOOK_INBOX_RETRY_BASE_SECONDS: int = 15
+    WEBHOOK_INBOX_LEASE_SECONDS: int = 120
+    # Processed events are deleted after this many days (0 keeps them forever)
+    WEBHOOK_INBOX_RETENTION_DAYS: int = 30
 
     # MongoDB (optional)
     USE_MONGO: bool = True
@@ -78,6 +128,8 @@ class Settings(BaseSettings):
     PAYPAL_CURRENCY: str = "USD"
     PAYPAL_RETURN_URL: str = "http://localhost:5173/wallet?paypal=success"
     PAYPAL_CANCEL_URL: str = "http://localhost:5173/wallet?paypal=cancel"
+    # Refresh the cached OAuth token in the background once it is this close to expiry
+    PAYPAL_TOKEN_REFRESH_MARGIN_SECONDS: int = 300
     
     # Razorpay (Sandbox by default)
     # Note: Razorpay uses the same API URL (https://api.razorpay.com/v1) for both test and live modes
@@ -89,6 +141,12 @@ class Settings(BaseSettings):
     RAZORPAY_CURRENCY: str = "INR"
     RAZORPAY_RETURN_URL: str = "http://localhost:5173/wallet?razorpay=success"  # Override with FRONTEND_URL in production
     RAZORPAY_CANCEL_URL: str = "http://localhost:5173/wallet?razorpay=cancel"  # Override with FRONTEND_URL in production
+
+    # FX rates used for provider currency conversion ("BASE:QUOTE" pairs)
+    FX_RATE_PAIRS: List[str] = ["USD:INR"]
+    FX_FALLBACK_RATES: Dict[str, float] = {"USD:INR": 85.0}
+    FX_REFRESH_INTERVAL_SECONDS: int = 900
+    FX_FETCH_TIMEOUT_SECONDS: float = 10.0
     
     # Referral settings
     REFERRAL_CREDIT_AMOUNT: int = 1
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Each worker process builds its own context on first use
+_worker_context: Optional[CryptContext] = None
+
+
+def _get_worker_context() -> CryptContext:
+    global _worker_context
+    if _worker_context is None:
+        _worker_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _worker_context
+
+
+def _hash_in_worker(password: str) -> str:
+    return _get_worker_context().hash(password)
+
+
+def _verify_in_worker(plain_password: str, hashed_password: str) -> bool:
+    return _get_worker_context().verify(plain_password, hashed_password)
+
+
+class PasswordHashPool:
+    """Bounded process pool for bcrypt work.
+
+    bcrypt is CPU-bound (~200-300 ms per call), so running it inline stalls the
+    event loop for every other request on the worker. Calls are admitted through
+    a semaphore sized to workers + max_pending; once that is exhausted callers wait
+    up to queue_timeout seconds and are then rejected with 503 (backpressure).
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float):
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(0, int(max_pending))
+        self.queue_timeout = float(queue_timeout)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._restart_lock: Optional[asyncio.Lock] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_ms = 0.0
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(f"Password hash pool started with {self.max_workers} worker(s)")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Password hash pool stopped")
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_ms": round(self._total_ms / self._completed, 2) if self._completed else 0.0,
+        }
+
+    async def _acquire_slot(self) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_pending)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            logger.warning("Password hash pool saturated; rejecting request")
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            self._waiting -= 1
+
+    async def _restart(self, broken: Optional[ProcessPoolExecutor]) -> None:
+        """Replace the pool, unless a concurrent caller already replaced `broken`."""
+        if self._restart_lock is None:
+            self._restart_lock = asyncio.Lock()
+        async with self._restart_lock:
+            if self._executor is not broken:
+                return
+            logger.error("Password hash pool broken; restarting")
+            self.shutdown()
+            self.start()
+
+    async def _run(self, fn, *args):
+        await self._acquire_slot()
+        self._in_flight += 1
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            if self._executor is None:
+                self.start()
+            loop = asyncio.get_running_loop()
+            executor = self._executor
+            try:
+                result = await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM killed); rebuild the pool once and retry
+                await self._restart(executor)
+                result = await loop.run_in_executor(self._executor, fn, *args)
+            succeeded = True
+            return result
+        finally:
+            self._in_flight -= 1
+            if succeeded:
+                self._completed += 1
+                self._total_ms += (time.perf_counter() - start) * 1000.0
+            else:
+                self._failed += 1
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash_in_worker, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify_in_worker, plain_password, hashed_password)
+
+
+password_hasher = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+)
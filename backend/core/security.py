@@ -4,7 +4,11 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from core.config import settings
+from core.password_hasher import password_hasher
+from utils.cache import LRUCache
+import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,14 @@ def get_password_hash(password: str) -> str:
     """Generate password hash"""
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the hashing process pool (never blocks the event loop)"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash in the hashing process pool"""
+    return await password_hasher.hash(password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -55,6 +67,33 @@ def verify_token(token: str) -> Optional[dict]:
         logger.warning(f"JWT decode failed: {e}")
         return None
 
+# Recently verified tokens keyed by sha256(token); entries never outlive the token's exp
+_verified_tokens = LRUCache(max_entries=settings.TOKEN_CACHE_SIZE)
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """Verify and decode JWT token, reusing a recent verification of the same token.
+
+    The returned payload is shared with the cache and must be treated as read-only.
+    """
+    if not token:
+        return None
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+    payload = verify_token(token)
+    if payload is None:
+        return None
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = float(exp) - time.time()
+        if remaining > 0:
+            _verified_tokens.set(key, payload, ttl=remaining)
+    return payload
+
+def token_cache_stats() -> dict:
+    return _verified_tokens.stats()
+
 def get_current_user_from_token(token: str) -> Optional[str]:
     """Extract username from token"""
     payload = verify_token(token)
@@ -1,9 +1,61 @@
 from db.session import Base, engine
 import logging
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
 
+# Indexes declared on tables that existing deployments created before the index
+# was added. create_all() never alters an existing table, so these are created
+# here (once) when missing.
+ADDED_INDEXES = (
+    ("user_subscriptions", "ix_user_subs_user_service_end"),
+    ("user_subscriptions", "ix_user_subs_active_end"),
+)
+
+def ensure_added_indexes(conn) -> None:
+    """Create any ADDED_INDEXES missing from the database (sync; use with run_sync)."""
+    inspector = inspect(conn)
+    for table_name, index_name in ADDED_INDEXES:
+        table = Base.metadata.tables.get(table_name)
+        if table is None or not inspector.has_table(table_name):
+            continue
+        if index_name in {ix["name"] for ix in inspector.get_indexes(table_name)}:
+            continue
+        index = next(ix for ix in table.indexes if ix.name == index_name)
+        try:
+            index.create(conn)
+            logger.info(f"Created index {index_name} on {table_name}")
+        except Exception as e:
+            # Another worker may have created it at the same time
+            logger.warning(f"Could not create index {index_name} on {table_name}: {e}")
+
+# Columns added to existing tables, same reason; each needs a server default
+ADDED_COLUMNS = (
+    ("users", "data_version"),
+)
+
+def ensure_added_columns(conn) -> None:
+    """Add any ADDED_COLUMNS missing from the database (sync; use with run_sync)."""
+    inspector = inspect(conn)
+    for table_name, column_name in ADDED_COLUMNS:
+        table = Base.metadata.tables.get(table_name)
+        if table is None or not inspector.has_table(table_name):
+            continue
+        if column_name in {c["name"] for c in inspector.get_columns(table_name)}:
+            continue
+        column = table.columns[column_name]
+        ddl = (
+            f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column.type.compile(conn.dialect)}"
+            f" {'' if column.nullable else 'NOT NULL '}DEFAULT {column.server_default.arg}"
+        )
+        try:
+            conn.execute(text(ddl))
+            logger.info(f"Added column {column_name} to {table_name}")
+        except Exception as e:
+            # Another worker may have added it at the same time
+            logger.warning(f"Could not add column {column_name} to {table_name}: {e}")
+
 async def initialize_database():
     """Create tables only. Use database_setup.ipynb for seeding data."""
     try:
@@ -11,7 +63,9 @@ async def initialize_database():
         assert isinstance(engine, AsyncEngine)
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
-            # Ensure indexes exist (create_all will create them if missing)
+            # create_all skips existing tables, so add columns and indexes introduced since
+            await conn.run_sync(ensure_added_columns)
+            await conn.run_sync(ensure_added_indexes)
         logger.info("Database tables created successfully")
         
         # Note: Data seeding is now handled by database_setup.ipynb
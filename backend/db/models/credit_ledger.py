@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from sqlalchemy.types import JSON
+from db.session import Base
+
+
+class CreditLedgerEntry(Base):
+    """Append-only record of every wallet balance change.
+
+    external_ref (e.g. "paypal:<order_id>") is unique, so a provider event can only
+    ever be credited once; NULL refs (manual/admin changes) are not deduplicated.
+    """
+    __tablename__ = "credit_ledger"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    username = Column(String(255), nullable=False)
+    delta = Column(Integer, nullable=False)
+    balance_after = Column(Integer, nullable=True)
+    reason = Column(String(50), nullable=False)
+    external_ref = Column(String(255), unique=True, nullable=True)
+    details = Column(JSON, default=dict)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Keyset pagination over (created_at, id) per user is served entirely by this index
+        Index("ix_credit_ledger_username_created", "username", "created_at", "id"),
+    )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Float, DateTime
+from db.session import Base
+
+
+class FxRate(Base):
+    """Last known good exchange rate per currency pair (e.g. "USD:INR"), shared by all workers."""
+    __tablename__ = "fx_rates"
+
+    pair = Column(String(16), primary_key=True)
+    rate = Column(Float, nullable=False)
+    fetched_at = Column(DateTime(timezone=True), nullable=False)
@@ -30,6 +30,10 @@ class UserSubscription(Base):
     __table_args__ = (
         Index("ix_user_subs_user_service_active", "user_id", "service_id", "is_active"),
         Index("ix_user_subs_user_account", "user_id", "account_id"),
+        # Per-user catalog overlay: MAX(end_date) GROUP BY service_id from the index alone
+        Index("ix_user_subs_user_service_end", "user_id", "service_id", "end_date"),
+        # Expiry sweeper: active subscriptions past their end date, oldest first
+        Index("ix_user_subs_active_end", "is_active", "end_date"),
     )
 
 
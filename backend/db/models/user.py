@@ -14,6 +14,8 @@ class User(Base):
     hashed_password = Column(String(255), nullable=False)
     role = Column(String(50), default="user", nullable=False)
     credits = Column(Integer, default=0, nullable=False)
+    # Bumped with every change to the user's credits, subscriptions or profile (response ETags)
+    data_version = Column(Integer, default=0, server_default="0", nullable=False)
     btc_address = Column(String(255), default="")
     services = Column(JSON, default=list)
     profile = Column(JSON, default=dict)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from sqlalchemy.sql import func
+from db.session import Base
+
+
+class WebhookInbox(Base):
+    """Verified provider webhooks waiting to be processed by services.webhook_inbox.
+
+    event_key is unique, so a redelivered event is stored (and processed) once.
+    """
+    __tablename__ = "webhook_inbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String(30), nullable=False)
+    event_key = Column(String(255), unique=True, nullable=False)
+    payload = Column(Text, nullable=False)
+    # pending -> processing -> done | failed (rejected, or after WEBHOOK_INBOX_MAX_ATTEMPTS)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(String(500), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_inbox_status_next_attempt", "status", "next_attempt_at"),
+    )
@@ -1,5 +1,6 @@
 import logging
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 import certifi
@@ -45,6 +46,37 @@ def get_mongo_db() -> Optional[AsyncIOMotorDatabase]:
     _mongo_db = _mongo_client[settings.MONGO_DB]
     return _mongo_db
 
+_supports_transactions: Optional[bool] = None
+
+async def mongo_supports_transactions() -> bool:
+    """Multi-document transactions need a replica set or sharded cluster (Atlas always is)."""
+    global _supports_transactions
+    if _supports_transactions is None:
+        db = get_mongo_db()
+        if db is None:
+            return False
+        try:
+            hello = await db.command({"hello": 1})
+            _supports_transactions = bool(hello.get("setName") or hello.get("msg") == "isdbgrid")
+        except Exception as e:
+            logger.warning(f"Could not determine Mongo transaction support: {e}")
+            return False
+    return _supports_transactions
+
+@asynccontextmanager
+async def mongo_transaction():
+    """Yield a session with an open transaction, or None on a standalone server.
+
+    Pass the yielded value as `session=` to Motor calls; None means each write is
+    applied on its own, so callers must order writes to stay safe without it.
+    """
+    if get_mongo_db() is None or not await mongo_supports_transactions():
+        yield None
+        return
+    async with await _mongo_client.start_session() as session:
+        async with session.start_transaction():
+            yield session
+
 async def init_mongo_indexes():
     db = get_mongo_db()
     if db is None:
@@ -72,8 +104,24 @@ async def init_mongo_indexes():
             # Services
             await db.services.create_index("name", unique=True, name="u_service_name")
             # Subscriptions
-            await db.subscriptions.create_index([("username", 1), ("service_name", 1)], name="i_user_service")
+            # One subscription per user and service: purchases turn a concurrent first
+            # purchase into an extension on the duplicate key error
+            try:
+                existing = await db.subscriptions.index_information()
+                if "i_user_service" in existing:
+                    await db.subscriptions.drop_index("i_user_service")
+                await db.subscriptions.create_index([("username", 1), ("service_name", 1)], unique=True, name="u_user_service")
+            except Exception as e:
+                logger.warning(f"Could not create unique index u_user_service (run migrate_unique_subscriptions.py): {e}")
+                await db.subscriptions.create_index([("username", 1), ("service_name", 1)], name="i_user_service")
             await db.subscriptions.create_index("is_active", name="i_active")
+            # end_date range scans (expiry, expiring soon, active seats); dates are BSON dates
+            # once migrate_subscription_dates.py has run
+            await db.subscriptions.create_index("end_date", name="i_sub_end_date")
+            await db.subscriptions.create_index([("is_active", 1), ("end_date", 1)], name="i_active_end_date")
+            await db.subscriptions.create_index(
+                [("service_name", 1), ("is_active", 1), ("end_date", 1)], name="i_service_active_end_date"
+            )
             # Refresh tokens
             await db.refresh_tokens.create_index("token", unique=True, name="u_token")
             await db.refresh_tokens.create_index("username", name="i_rt_username")
@@ -92,6 +140,32 @@ async def init_mongo_indexes():
             await db.analytics_events.create_index([("target_username", 1), ("created_at", -1)], name="i_analytics_target_created_at")
             await db.analytics_events.create_index([("status", 1), ("created_at", -1)], name="i_analytics_status_created_at")
             await db.analytics_events.create_index("external_ref", name="i_analytics_external_ref")
+            # Email outbox (drained by services.email_outbox)
+            await db.email_outbox.create_index([("status", 1), ("next_attempt_at", 1)], name="i_outbox_status_next")
+            # Credit ledger: one entry per provider reference; manual entries have no ref
+            await db.credit_ledger.create_index(
+                "external_ref",
+                unique=True,
+                partialFilterExpression={"external_ref": {"$type": "string"}},
+                name="u_ledger_external_ref",
+            )
+            await db.credit_ledger.create_index(
+                [("username", 1), ("created_at", -1), ("_id", -1)], name="i_ledger_user_created_id"
+            )
+            # Webhook inbox (drained by services.webhook_inbox); event_key dedupes redeliveries
+            await db.webhook_inbox.create_index("event_key", unique=True, name="u_webhook_event_key")
+            await db.webhook_inbox.create_index([("status", 1), ("next_attempt_at", 1)], name="i_webhook_status_next")
+            if settings.WEBHOOK_INBOX_RETENTION_DAYS > 0:
+                # Only processed events have processed_at, so pending/failed ones never expire
+                try:
+                    await db.webhook_inbox.create_index(
+                        "processed_at",
+                        expireAfterSeconds=settings.WEBHOOK_INBOX_RETENTION_DAYS * 86400,
+                        name="ttl_webhook_processed_at",
+                    )
+                except Exception as e:
+                    # An existing TTL with another retention must be changed with collMod
+                    logger.warning(f"Could not create webhook_inbox TTL index: {e}")
             return
         except Exception as e:
             wait_s = min(2 ** attempt, 15)